@@ -0,0 +1,102 @@
+"""
+Shared HTTP helpers for the gateway clients: JSON encoding/decoding and pooled sessions.
+JSON uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+
+else:
+    loads = json.loads
+
+    def dumps(payload) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def parse_json(response) -> dict:
+    """Decode a response body, raising the same error ``response.json()`` would on invalid JSON."""
+    try:
+        return loads(response.content)
+    except json.JSONDecodeError as e:
+        raise RequestsJSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def map_concurrently(func, items: list, max_workers: int) -> list:
+    """
+    Call ``func`` on each item from a thread pool sharing the caller's session.
+    Returns one entry per item, in input order: the result, or the exception that call raised,
+    so a failure never hides which items already went through.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    return [future.exception() or future.result() for future in futures]
+
+
+class BoundedRetry(Retry):
+    """Retry whose sleeps are capped, so a large ``Retry-After`` cannot hold a request thread for long."""
+
+    MAX_RETRY_AFTER = 1.0
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.MAX_RETRY_AFTER)
+
+
+def connect_only_retry() -> BoundedRetry:
+    """Policy that retries only failed connections, for POSTs such as payouts that must never be sent twice."""
+    return BoundedRetry(
+        total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.3, backoff_max=BoundedRetry.MAX_RETRY_AFTER
+    )
+
+
+def build_session(
+    headers: dict[str, str], pool_maxsize: int = 50, pool_block: bool = False, retries: Retry | None = None
+) -> requests.Session:
+    """
+    Build a pooled session with retry/backoff for transient gateway responses.
+
+    Connection failures are retried, since nothing was sent. Once a request has been written it is
+    retried only on a 429 or 503 response, which normally means the provider did not process it; read
+    timeouts and dropped connections are never retried. A 503 can still come from a proxy after the
+    provider accepted the request, so clients whose POSTs must never repeat use ``connect_only_retry()``.
+    ``Retry-After`` is honoured but capped at ``BoundedRetry.MAX_RETRY_AFTER`` seconds per retry.
+
+    With ``pool_block`` the pool size caps concurrent requests; a connection goes back to the pool
+    while its request sleeps between retries, so throttled calls do not block the others.
+    Pass ``retries`` to replace the default policy.
+    """
+    if retries is None:
+        retries = BoundedRetry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            backoff_max=BoundedRetry.MAX_RETRY_AFTER,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, pool_block=pool_block, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
@@ -1,5 +1,5 @@
 """
-Cryptomus Payment Service Package
+CoinGate Payment Service Package
 """
 
 from apps.services.coingate.dto import CoinGatePayment
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CoinGatePayment:
     """Data transfer object for CoinGate payment details.
     This class encapsulates the necessary information to create a payment order
@@ -32,3 +32,9 @@ class CoinGatePayment:
     success_url: Optional[str] = None
     token: Optional[str] = None
     purchaser_email: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _COINGATE_PAYMENT_FIELDS}
+
+
+_COINGATE_PAYMENT_FIELDS = tuple(f.name for f in fields(CoinGatePayment))
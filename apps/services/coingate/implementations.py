@@ -1,13 +1,36 @@
 import logging
+from functools import cache
+from types import MappingProxyType
 
 import requests
 from django.conf import settings
 
+from apps.services._http import build_session, dumps, map_concurrently, parse_json
 from apps.services.coingate.abstract import AbstractPaymentGateway
 from apps.services.coingate.dto import CoinGatePayment
 
 logger = logging.getLogger(__name__)
 
+STATUS_MAPPING = MappingProxyType(
+    {
+        "new": "Invoice created, but payment method not selected. Expires in 2 hours.",
+        "pending": "Payment method selected, awaiting payment. Expires in 20 minutes if unpaid.",
+        "confirming": "Payment sent, awaiting blockchain confirmation.",
+        "paid": "Payment confirmed and received. Goods/services can be delivered.",
+        "invalid": "Payment was not confirmed or failed compliance checks.",
+        "expired": "Invoice expired due to no payment or no method selected within time limits.",
+        "canceled": "Invoice was canceled by the shopper.",
+        "refunded": "Full refund issued to the shopper.",
+        "partially_refunded": "Partial refund issued to the shopper.",
+    }
+)
+
+
+@cache
+def _coingate_setting(name: str):
+    """Read a CoinGate setting once per process, only when a constructor argument falls back to it."""
+    return getattr(settings, name)
+
 
 class CoinGateService(AbstractPaymentGateway):
     """
@@ -18,18 +41,34 @@ class CoinGateService(AbstractPaymentGateway):
     application's internal transaction status system.
     """
 
+    BATCH_MAX_WORKERS = 10
+    MAX_IN_FLIGHT = 20
+    # Indexed by the sandbox flag: (production, sandbox)
+    API_URLS = ("https://api.coingate.com/v2/orders", "https://api-sandbox.coingate.com/v2/orders")
+
     def __init__(self, api_key: str = None, sandbox: bool = None, base_url: str = None, backend_url: str = None):
         """
         Initialize the CoinGateService with API key and sandbox mode.
         """
-        self.api_key = api_key or settings.COINGATE_API_KEY
-        self.sandbox = sandbox or settings.COINGATE_SANDBOX
-        self.base_url = base_url or settings.BASE_URL
-        self.backend_url = backend_url or settings.BACKEND_URL
-        self.api_url = (
-            "https://api-sandbox.coingate.com/v2/orders" if self.sandbox else "https://api.coingate.com/v2/orders"
+        self.api_key = api_key or _coingate_setting("COINGATE_API_KEY")
+        self.sandbox = sandbox or _coingate_setting("COINGATE_SANDBOX")
+        self.base_url = base_url or _coingate_setting("BASE_URL")
+        self.backend_url = backend_url or _coingate_setting("BACKEND_URL")
+        self.api_url = self.API_URLS[bool(self.sandbox)]
+        # A blocking pool of MAX_IN_FLIGHT connections caps concurrent requests so bursts stay under
+        # CoinGate's per-key rate limit; connections are released while a request sleeps between retries
+        self.session = build_session(
+            {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            pool_maxsize=self.MAX_IN_FLIGHT,
+            pool_block=True,
         )
 
+    def close(self):
+        """
+        Release the pooled connections held by the underlying session.
+        """
+        self.session.close()
+
     def create_order(self, payment: CoinGatePayment):
         """
         Create a new payment order with CoinGate for cryptocurrency transactions.
@@ -47,41 +86,37 @@ class CoinGateService(AbstractPaymentGateway):
             requests.RequestException: If there's an error communicating with the CoinGate API
         """
         try:
-            data = {
-                "order_id": payment.order_id,
-                "price_amount": payment.price_amount,
-                "price_currency": payment.price_currency,
-                "receive_currency": payment.receive_currency,
-                "title": payment.title,
-                "description": payment.description,
-                "callback_url": payment.callback_url,
-                "cancel_url": payment.cancel_url,
-                "success_url": payment.success_url,
-                "token": payment.token,
-                "purchaser_email": payment.purchaser_email,
-            }
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.post(self.api_url, json=data, headers=headers)
+            response = self.session.post(self.api_url, data=dumps(payment.to_dict()), timeout=10)
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except requests.RequestException as e:
-            logger.error(f"Error creating CoinGate order: {e}")
+            logger.error("Error creating CoinGate order: %s", e)
             return None
         except ValueError as e:
-            logger.error(f"Error parsing CoinGate response: {e}")
+            logger.error("Error parsing CoinGate response: %s", e)
             return None
 
+    def create_orders_batch(self, payments: list[CoinGatePayment]) -> list:
+        """
+        Create several CoinGate orders concurrently.
+
+        Args:
+            payments (list[CoinGatePayment]): The payments to create orders for
+
+        Returns:
+            list: One entry per payment, in input order: what ``create_order`` returned,
+            or the exception it raised for that payment
+        """
+        return map_concurrently(self.create_order, payments, self.BATCH_MAX_WORKERS)
+
     def map_status(self, external_status):
-        status_mapping = {
-            "new": "Invoice created, but payment method not selected. Expires in 2 hours.",
-            "pending": "Payment method selected, awaiting payment. Expires in 20 minutes if unpaid.",
-            "confirming": "Payment sent, awaiting blockchain confirmation.",
-            "paid": "Payment confirmed and received. Goods/services can be delivered.",
-            "invalid": "Payment was not confirmed or failed compliance checks.",
-            "expired": "Invoice expired due to no payment or no method selected within time limits.",
-            "canceled": "Invoice was canceled by the shopper.",
-            "refunded": "Full refund issued to the shopper.",
-            "partially_refunded": "Partial refund issued to the shopper.",
-        }
-        logger.debug(f"Mapping external status: {external_status}: {status_mapping.get(external_status, 'UNKNOWN')}")
-        return status_mapping.get(external_status, "UNKNOWN")
+        status = STATUS_MAPPING.get(external_status, "UNKNOWN")
+        logger.debug("Mapping external status: %s: %s", external_status, status)
+        return status
+
+    def map_statuses(self, external_statuses: list[str]) -> list[str]:
+        """
+        Map a batch of CoinGate statuses in one pass, e.g. for replayed or backfilled callbacks.
+        """
+        get_status = STATUS_MAPPING.get
+        return [get_status(status, "UNKNOWN") for status in external_statuses]
@@ -1,14 +1,39 @@
+from functools import lru_cache
+
 from apps.orders.models import Order
 from apps.services.coingate.dto import CoinGatePayment
 from apps.services.coingate.implementations import CoinGateService
 
 
+@lru_cache(maxsize=1)
+def get_coingate_gateway() -> CoinGateService:
+    """
+    Return the process-wide CoinGate gateway so its pooled connections outlive a single request.
+
+    Settings are read once, the first time this is called.
+    """
+    return CoinGateService()
+
+
 class PaymentService:
-    def __init__(self):
-        self.gateway = CoinGateService()
+    def __init__(self, gateway: CoinGateService = None):
+        self.gateway = gateway or get_coingate_gateway()
 
     def create_payment(self, order: Order, cryptocurrency: str):
-        dto = CoinGatePayment(
+        return self.gateway.create_order(self._build_payment(order, cryptocurrency))
+
+    def create_payments(self, orders: list[Order], cryptocurrency: str):
+        dtos = [self._build_payment(order, cryptocurrency) for order in orders]
+        return self.gateway.create_orders_batch(dtos)
+
+    def map_payment_status(self, coingate_status: str):
+        return self.gateway.map_status(coingate_status)
+
+    def map_payment_statuses(self, coingate_statuses: list[str]):
+        return self.gateway.map_statuses(coingate_statuses)
+
+    def _build_payment(self, order: Order, cryptocurrency: str) -> CoinGatePayment:
+        return CoinGatePayment(
             order_id=str(order.id),
             price_amount=float(order.total_price),
             price_currency="USD",
@@ -19,7 +44,3 @@ class PaymentService:
             title=f"Order #{order.id}",
             description=f"Payment for Order #{order.id}"
         )
-        return self.gateway.create_order(dto)
-
-    def map_payment_status(self, coingate_status: str):
-        return self.gateway.map_status(coingate_status)
@@ -3,7 +3,7 @@ Cryptomus Payment Service Package
 """
 
 from apps.services.cryptomus.dto import PaymentRequest, PayoutRequest
-from apps.services.cryptomus.service import CryptomusService
+from apps.services.cryptomus.service import CryptomusService, get_cryptomus_service
 
 __version__ = "1.0.0"
-__all__ = ["CryptomusService", "PaymentRequest", "PayoutRequest"]
+__all__ = ["CryptomusService", "PaymentRequest", "PayoutRequest", "get_cryptomus_service"]
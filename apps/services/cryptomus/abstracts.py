@@ -11,11 +11,18 @@ from apps.services.cryptomus.dto import PaymentRequest, PayoutRequest
 class SignatureGenerator(ABC):
     """Abstract signature generator"""
 
+    __slots__ = ()
+
     @abstractmethod
     def generate_request_signature(self, payload: dict) -> str:
         """Generate signature for API requests"""
         pass
 
+    @abstractmethod
+    def generate_request_signature_bytes(self, payload_bytes: bytes) -> str:
+        """Generate signature for an already serialized request body"""
+        pass
+
     @abstractmethod
     def verify_webhook_signature(self, data: bytes, signature: str) -> bool:
         """Verify webhook signature"""
@@ -25,8 +32,10 @@ class SignatureGenerator(ABC):
 class HttpClient(ABC):
     """Abstract HTTP client"""
 
+    __slots__ = ()
+
     @abstractmethod
-    def post(self, url: str, data: str, headers: dict[str, str]) -> dict:
+    def post(self, url: str, data: bytes, headers: dict[str, str]) -> dict:
         """Send POST request"""
         pass
 
@@ -34,6 +43,8 @@ class HttpClient(ABC):
 class PaymentProcessor(ABC):
     """Abstract payment processor"""
 
+    __slots__ = ()
+
     @abstractmethod
     def create_payment(self, request: PaymentRequest) -> dict:
         """Create payment"""
@@ -48,6 +59,8 @@ class PaymentProcessor(ABC):
 class PayoutProcessor(ABC):
     """Abstract payout processor"""
 
+    __slots__ = ()
+
     @abstractmethod
     def create_payout(self, request: PayoutRequest) -> dict:
         """Create payout"""
@@ -62,6 +75,8 @@ class PayoutProcessor(ABC):
 class WebhookValidator(ABC):
     """Abstract webhook validator"""
 
+    __slots__ = ()
+
     @abstractmethod
     def validate_webhook(self, data: bytes, signature: str) -> bool:
         """Validate webhook"""
@@ -71,6 +86,8 @@ class WebhookValidator(ABC):
 class ApiClient(ABC):
     """Abstract API client"""
 
+    __slots__ = ()
+
     @abstractmethod
     def make_request(self, endpoint: str, payload: dict) -> dict:
         """Make API request"""
@@ -6,7 +6,7 @@ Single Responsibility: Handle data structures
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentRequest:
     """Payment request data"""
 
@@ -14,6 +14,10 @@ class PaymentRequest:
     currency: str
     order_id: str
     lifetime: int = 15 * 60
+    url_callback: str | None = None
+    url_return: str | None = None
+    url_success: str | None = None
+    network: str | None = None
     additional_params: dict | None = None
 
     def to_dict(self) -> dict:
@@ -23,12 +27,20 @@ class PaymentRequest:
             "order_id": self.order_id,
             "lifetime": self.lifetime,
         }
+        if self.url_callback:
+            result["url_callback"] = self.url_callback
+        if self.url_return:
+            result["url_return"] = self.url_return
+        if self.url_success:
+            result["url_success"] = self.url_success
+        if self.network:
+            result["network"] = self.network
         if self.additional_params:
             result.update(self.additional_params)
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PayoutRequest:
     """Payout request data"""
 
@@ -8,9 +8,11 @@ import hashlib
 import hmac
 import json
 import logging
+from functools import lru_cache
 
 import requests
 
+from apps.services._http import build_session, connect_only_retry, dumps, parse_json
 from apps.services.cryptomus.abstracts import (
     ApiClient,
     HttpClient,
@@ -21,20 +23,46 @@ from apps.services.cryptomus.abstracts import (
 )
 from apps.services.cryptomus.dto import PaymentRequest, PayoutRequest
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# Shared by every client in the process so calls reuse pooled keep-alive connections to Cryptomus.
+# Every Cryptomus call is a POST, payouts included, and carries no idempotency key: only failed
+# connections are retried, so a request that reached the server is never sent a second time.
+_SESSION = build_session({}, pool_maxsize=100, retries=connect_only_retry())
+
 
 class CryptomusSignatureGenerator(SignatureGenerator):
     """Cryptomus signature generator implementation"""
 
+    __slots__ = ("api_key", "_api_key_bytes", "_sign")
+    logger = logging.getLogger(f"{__name__}.CryptomusSignatureGenerator")
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._api_key_bytes = api_key.encode("utf-8")
+        self._sign = self._build_signer(self._api_key_bytes)
+
+    @staticmethod
+    def _build_signer(key: bytes):
+        """Specialize the signing routine for a fixed key; the closure does no attribute lookups per call"""
+        md5, b64encode = hashlib.md5, base64.b64encode
+
+        def sign(body: bytes) -> str:
+            return md5(b64encode(body) + key, usedforsecurity=False).hexdigest()
+
+        return sign
 
     def generate_request_signature(self, payload: dict) -> str:
         """Generate MD5 signature for API requests"""
-        self.logger.debug(f"Generating signature for payload: {payload}")
-        payload_str = json.dumps(payload, separators=(",", ":"))
-        base64_data = base64.b64encode(payload_str.encode("utf-8")).decode("utf-8")
-        signature = hashlib.md5((base64_data + self.api_key).encode("utf-8")).hexdigest()
+        self.logger.debug("Generating signature for payload: %s", payload)
+        return self.generate_request_signature_bytes(dumps(payload))
+
+    def generate_request_signature_bytes(self, payload_bytes: bytes) -> str:
+        """Generate MD5 signature for an already serialized request body"""
+        signature = self._sign(payload_bytes)
         self.logger.debug("Signature generated successfully")
         return signature
 
@@ -45,39 +73,87 @@ class CryptomusSignatureGenerator(SignatureGenerator):
 
         try:
             payload_str = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
-            base64_encoded = base64.b64encode(payload_str.encode("utf-8")).decode("utf-8")
-            combined = base64_encoded + self.api_key
-            generated_signature = hashlib.md5(combined.encode("utf-8")).hexdigest()
+            # Feed the key separately rather than concatenating, so large callbacks are not copied again
+            digest = hashlib.md5(base64.b64encode(payload_str.encode("utf-8")), usedforsecurity=False)
+            digest.update(self._api_key_bytes)
+            generated_signature = digest.hexdigest()
             return hmac.compare_digest(generated_signature, signature)
         except TypeError as e:
-            self.logger.error(f"JSON serialization error: {e}")
+            self.logger.error("JSON serialization error: %s", e)
             return False
 
 
 class RequestsHttpClient(HttpClient):
     """HTTP client using requests library"""
 
-    def __init__(self):
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    __slots__ = ("_session",)
+    logger = logging.getLogger(f"{__name__}.RequestsHttpClient")
+    TIMEOUT = (3.05, 10)
 
-    def post(self, url: str, data: str, headers: dict[str, str]) -> dict:
+    def __init__(self, session: requests.Session | None = None):
+        self._session = session or _SESSION
+
+    def get_session(self) -> requests.Session:
+        """Return the underlying session, e.g. to mount a custom adapter"""
+        return self._session
+
+    def post(self, url: str, data: bytes, headers: dict[str, str]) -> dict:
         """Send POST request using requests"""
-        self.logger.info(f"Making POST request to: {url}")
+        self.logger.debug("Making POST request to: %s", url)
 
         try:
-            response = requests.post(url, data=data, headers=headers)
+            response = self._session.request("POST", url, data=data, headers=headers, timeout=self.TIMEOUT)
             response.raise_for_status()
-            result = response.json()
-            self.logger.debug(f"Response received: {result}")
+            result = parse_json(response)
+            self.logger.debug("Response received: %s", result)
             return result
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"HTTP request failed: {str(e)}")
+            self.logger.error("HTTP request failed: %s", e)
+            raise
+
+
+@lru_cache(maxsize=1)
+def _get_httpx_client():
+    if httpx is None:
+        raise ImportError("The httpx transport requires httpx: pip install 'httpx[http2]'")
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        timeout=10.0,
+    )
+
+
+class HttpxHttpClient(HttpClient):
+    """HTTP client using httpx; multiplexes concurrent calls over one HTTP/2 connection"""
+
+    __slots__ = ("_client",)
+    logger = logging.getLogger(f"{__name__}.HttpxHttpClient")
+
+    def __init__(self, client=None):
+        self._client = client or _get_httpx_client()
+
+    def post(self, url: str, data: bytes, headers: dict[str, str]) -> dict:
+        """Send POST request using httpx"""
+        self.logger.debug("Making POST request to: %s", url)
+
+        try:
+            response = self._client.post(url, content=data, headers=headers)
+            response.raise_for_status()
+            result = parse_json(response)
+            self.logger.debug("Response received: %s", result)
+            return result
+        except (httpx.HTTPError, requests.exceptions.JSONDecodeError) as e:
+            self.logger.error("HTTP request failed: %s", e)
             raise
 
 
 class CryptomusApiClient(ApiClient):
     """Cryptomus API client implementation"""
 
+    __slots__ = ("base_url", "merchant_id", "signature_generator", "http_client", "_urls", "_base_headers")
+    logger = logging.getLogger(f"{__name__}.CryptomusApiClient")
+    ENDPOINTS = ("payment", "payment/info", "payout", "payout/info")
+
     def __init__(
         self, base_url: str, merchant_id: str, signature_generator: SignatureGenerator, http_client: HttpClient
     ):
@@ -85,66 +161,70 @@ class CryptomusApiClient(ApiClient):
         self.merchant_id = merchant_id
         self.signature_generator = signature_generator
         self.http_client = http_client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._urls = {endpoint: f"{base_url}/{endpoint}" for endpoint in self.ENDPOINTS}
+        self._base_headers = {"merchant": merchant_id, "Content-Type": "application/json"}
 
     def make_request(self, endpoint: str, payload: dict) -> dict:
         """Make API request to Cryptomus"""
-        self.logger.info(f"Making API request to endpoint: {endpoint}")
+        self.logger.debug("Making API request to endpoint: %s", endpoint)
 
-        url = f"{self.base_url}/{endpoint}"
-        data_json = json.dumps(payload, separators=(",", ":"))
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        # Serialize once: the signature must cover exactly the bytes that are sent
+        data_bytes = dumps(payload)
 
-        headers = {
-            "merchant": self.merchant_id,
-            "sign": self.signature_generator.generate_request_signature(payload),
-            "Content-Type": "application/json",
-        }
+        headers = {**self._base_headers, "sign": self.signature_generator.generate_request_signature_bytes(data_bytes)}
 
-        return self.http_client.post(url, data_json, headers)
+        return self.http_client.post(url, data_bytes, headers)
 
 
 class CryptomusPaymentProcessor(PaymentProcessor):
     """Cryptomus payment processor implementation"""
 
+    __slots__ = ("api_client",)
+    logger = logging.getLogger(f"{__name__}.CryptomusPaymentProcessor")
+
     def __init__(self, api_client: ApiClient):
         self.api_client = api_client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def create_payment(self, request: PaymentRequest) -> dict:
         """Create payment using Cryptomus API"""
-        self.logger.info(f"Creating payment: amount={request.amount}, currency={request.currency}")
+        self.logger.info("Creating payment: amount=%s, currency=%s", request.amount, request.currency)
         return self.api_client.make_request("payment", request.to_dict())
 
     def get_payment_status(self, payment_uuid: str) -> dict:
         """Get payment status using Cryptomus API"""
-        self.logger.info(f"Checking payment status for UUID: {payment_uuid}")
+        self.logger.debug("Checking payment status for UUID: %s", payment_uuid)
         return self.api_client.make_request("payment/info", {"uuid": payment_uuid})
 
 
 class CryptomusPayoutProcessor(PayoutProcessor):
     """Cryptomus payout processor implementation"""
 
+    __slots__ = ("api_client",)
+    logger = logging.getLogger(f"{__name__}.CryptomusPayoutProcessor")
+
     def __init__(self, api_client: ApiClient):
         self.api_client = api_client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def create_payout(self, request: PayoutRequest) -> dict:
         """Create payout using Cryptomus API"""
-        self.logger.info(f"Creating payout: amount={request.amount}, currency={request.currency}")
+        self.logger.info("Creating payout: amount=%s, currency=%s", request.amount, request.currency)
         return self.api_client.make_request("payout", request.to_dict())
 
     def get_payout_status(self, payout_uuid: str) -> dict:
         """Get payout status using Cryptomus API"""
-        self.logger.info(f"Checking payout status for UUID: {payout_uuid}")
+        self.logger.debug("Checking payout status for UUID: %s", payout_uuid)
         return self.api_client.make_request("payout/info", {"uuid": payout_uuid})
 
 
 class CryptomusWebhookValidator(WebhookValidator):
     """Cryptomus webhook validator implementation"""
 
+    __slots__ = ("signature_generator",)
+    logger = logging.getLogger(f"{__name__}.CryptomusWebhookValidator")
+
     def __init__(self, signature_generator: SignatureGenerator):
         self.signature_generator = signature_generator
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def validate_webhook(self, data: bytes, signature: str) -> bool:
         """Validate webhook signature"""
@@ -4,9 +4,13 @@ Single Responsibility: Orchestrate operations between processors
 """
 
 import logging
+from contextvars import ContextVar
+from functools import cached_property, lru_cache, wraps
+from time import perf_counter_ns
 
 from django.conf import settings
 
+from apps.services._http import map_concurrently
 from apps.services.cryptomus.dto import PaymentRequest, PayoutRequest
 from apps.services.cryptomus.implementations import (
     CryptomusApiClient,
@@ -14,9 +18,45 @@ from apps.services.cryptomus.implementations import (
     CryptomusPayoutProcessor,
     CryptomusSignatureGenerator,
     CryptomusWebhookValidator,
+    HttpxHttpClient,
     RequestsHttpClient,
 )
 
+logger = logging.getLogger(__name__)
+
+# One HTTP client per process: every service instance shares its pooled connections
+_SHARED_HTTP_CLIENT = RequestsHttpClient()
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+# Calls slower than this are logged even when DEBUG is off
+SLOW_CALL_NS = 2_000_000_000
+_last_call_ns: ContextVar[int] = ContextVar("cryptomus_last_call_ns", default=0)
+
+
+def last_call_ns() -> int:
+    """Duration of the last timed CryptomusService call made in the current context"""
+    return _last_call_ns.get()
+
+
+def timed(func):
+    """Record the call duration on a context variable; log it only at DEBUG or when slow"""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            _last_call_ns.set(elapsed)
+            if elapsed > SLOW_CALL_NS:
+                logger.warning("%s took %.1f ms", name, elapsed / 1e6)
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s took %.1f ms", name, elapsed / 1e6)
+
+    return wrapper
+
 
 class CryptomusService:
     """
@@ -24,49 +64,93 @@ class CryptomusService:
     Single responsibility: Coordinate between different processors
     """
 
+    BATCH_MAX_WORKERS = 10
+
     def __init__(
         self,
         api_key: str | None = None,
         merchant_id: str | None = None,
         base_url: str = "https://api.cryptomus.com/v1",
+        transport: str = "requests",
     ):
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self.logger.info("Initializing CryptomusService")
+        logger.debug("Initializing CryptomusService")
 
         # Get configuration
         self.api_key = api_key or settings.CRYPTOMUS_API_KEY
         self.merchant_id = merchant_id or settings.CRYPTOMUS_MERCHANT_ID
         self.base_url = base_url
 
-        # Initialize components
+        # Initialize components; the API client and processors are built on first use
         self._signature_generator = CryptomusSignatureGenerator(self.api_key)
-        self._http_client = RequestsHttpClient()
-        self._api_client = CryptomusApiClient(
-            self.base_url, self.merchant_id, self._signature_generator, self._http_client
-        )
+        if transport == "requests":
+            self._http_client = _SHARED_HTTP_CLIENT
+        elif transport == "httpx":
+            self._http_client = HttpxHttpClient()
+        else:
+            raise ValueError(f"Unsupported transport: {transport}")
 
-        # Initialize processors
-        self._payment_processor = CryptomusPaymentProcessor(self._api_client)
-        self._payout_processor = CryptomusPayoutProcessor(self._api_client)
-        self._webhook_validator = CryptomusWebhookValidator(self._signature_generator)
+    @cached_property
+    def _api_client(self) -> CryptomusApiClient:
+        return CryptomusApiClient(self.base_url, self.merchant_id, self._signature_generator, self._http_client)
+
+    @cached_property
+    def _payment_processor(self) -> CryptomusPaymentProcessor:
+        return CryptomusPaymentProcessor(self._api_client)
+
+    @cached_property
+    def _payout_processor(self) -> CryptomusPayoutProcessor:
+        return CryptomusPayoutProcessor(self._api_client)
+
+    @cached_property
+    def _webhook_validator(self) -> CryptomusWebhookValidator:
+        return CryptomusWebhookValidator(self._signature_generator)
 
     # Payment operations
-    def create_payment(self, amount: float, currency: str, order_id: str, lifetime: int = 15 * 60, **kwargs) -> dict:
+    @timed
+    def create_payment(
+        self,
+        amount: float,
+        currency: str,
+        order_id: str,
+        lifetime: int = 15 * 60,
+        *,
+        url_callback: str | None = None,
+        url_return: str | None = None,
+        url_success: str | None = None,
+        network: str | None = None,
+        additional_params: dict | None = None,
+        **extra,
+    ) -> dict:
         """Create a new payment request"""
+        if extra:
+            additional_params = {**(additional_params or {}), **extra}
         payment_request = PaymentRequest(
             amount=amount,
             currency=currency,
             order_id=order_id,
             lifetime=lifetime,
-            additional_params=kwargs if kwargs else None,
+            url_callback=url_callback,
+            url_return=url_return,
+            url_success=url_success,
+            network=network,
+            additional_params=additional_params,
         )
         return self._payment_processor.create_payment(payment_request)
 
+    @timed
     def get_payment_status(self, payment_uuid: str) -> dict:
         """Check payment status using payment UUID"""
         return self._payment_processor.get_payment_status(payment_uuid)
 
+    @timed
+    def get_many_statuses(self, payment_uuids: list[str]) -> dict[str, dict | Exception]:
+        """Check several payments concurrently; maps each UUID to its status or the exception raised for it"""
+        unique_uuids = list(dict.fromkeys(payment_uuids))
+        statuses = map_concurrently(self._payment_processor.get_payment_status, unique_uuids, self.BATCH_MAX_WORKERS)
+        return dict(zip(unique_uuids, statuses))
+
     # Payout operations
+    @timed
     def create_payout(
         self, amount: float, currency: str, to_wallet: str, network: str | None = None, order_id: str | None = None
     ) -> dict:
@@ -76,13 +160,33 @@ class CryptomusService:
         )
         return self._payout_processor.create_payout(payout_request)
 
+    @timed
+    def create_payouts_batch(self, payout_requests: list[PayoutRequest]) -> list[dict | Exception]:
+        """
+        Create several payouts concurrently, returning the response or exception for each, in input order.
+        Retry only the payouts that failed: the others were sent.
+        """
+        return map_concurrently(self._payout_processor.create_payout, payout_requests, self.BATCH_MAX_WORKERS)
+
+    @timed
     def get_payout_status(self, payout_uuid: str) -> dict:
         """Check payout status using payout UUID"""
         return self._payout_processor.get_payout_status(payout_uuid)
 
     # Webhook operations
+    @timed
     def verify_signature(self, data: dict, provided_signature: str | None) -> bool:
         if not provided_signature:
-            self.logger.warning("No signature provided.")
+            logger.warning("No signature provided.")
+            return False
+        # MD5 hexdigest is always 32 lowercase hex chars; reject malformed probes without hashing the body
+        if len(provided_signature) != 32 or not _HEX_DIGITS.issuperset(provided_signature):
+            logger.warning("Malformed signature provided.")
             return False
         return self._webhook_validator.validate_webhook(data, provided_signature)
+
+
+@lru_cache(maxsize=1)
+def get_cryptomus_service() -> CryptomusService:
+    """Process-wide CryptomusService configured from Django settings"""
+    return CryptomusService()
@@ -1,8 +1,8 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateInvoiceDto:
     """
     Data transfer object (DTO) representing the parameters for creating a new invoice in the NowPayments payment system.
@@ -11,10 +11,10 @@ class CreateInvoiceDto:
         price_amount (float): The total amount to be paid.
         price_currency (str): The currency of the payment.
         order_id (str): Unique identifier for the order.
-        order_description (Optional[str], optional): Description of the order. Defaults to None.
         ipn_callback_url (str): Instant Payment Notification (IPN) callback URL.
         success_url (str): URL to redirect after successful payment.
         cancel_url (str): URL to redirect if payment is cancelled.
+        order_description (Optional[str], optional): Description of the order. Defaults to None.
         partially_paid_url (Optional[str], optional): URL for partially paid invoices. Defaults to None.
         is_fixed_rate (Optional[bool], optional): Flag for fixed rate pricing. Defaults to None.
         is_fee_paid_by_user (Optional[bool], optional): Flag indicating who pays the transaction fees. Defaults to None.
@@ -22,19 +22,30 @@ class CreateInvoiceDto:
     price_amount: float
     price_currency: str
     order_id: str
-    order_description: Optional[str] = None
     ipn_callback_url: str
     success_url: str
     cancel_url: str
+    order_description: Optional[str] = None
     partially_paid_url: Optional[str] = None
     is_fixed_rate: Optional[bool] = None
     is_fee_paid_by_user: Optional[bool] = None
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "price_amount": self.price_amount,
+            "price_currency": self.price_currency,
+            "order_id": self.order_id,
+            "ipn_callback_url": self.ipn_callback_url,
+            "success_url": self.success_url,
+            "cancel_url": self.cancel_url,
+            "order_description": self.order_description,
+            "partially_paid_url": self.partially_paid_url,
+            "is_fixed_rate": self.is_fixed_rate,
+            "is_fee_paid_by_user": self.is_fee_paid_by_user,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseInvoiceDto:
     """
     Data transfer object (DTO) representing the response from creating an invoice in the NowPayments payment system.
@@ -47,10 +58,10 @@ class ResponseInvoiceDto:
     payment_url: str
 
     def to_dict(self):
-        return asdict(self)
+        return {"payment_id": self.payment_id, "payment_url": self.payment_url}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebhookDto:
     """
     Data transfer object (DTO) representing a webhook payload from the NowPayments payment system.
@@ -63,4 +74,4 @@ class WebhookDto:
     payment_status: str
 
     def to_dict(self):
-        return asdict(self)
+        return {"payment_id": self.payment_id, "payment_status": self.payment_status}
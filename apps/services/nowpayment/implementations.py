@@ -1,41 +1,99 @@
 import logging
+import threading
+from collections import OrderedDict
+from functools import cache
+from types import MappingProxyType
 
-import requests
 from django.conf import settings
 from requests.exceptions import RequestException
 
+from apps.services._http import build_session, dumps, map_concurrently, parse_json
 from apps.services.nowpayment.abstract import NowPaymentAbstract
 from apps.services.nowpayment.exceptions import NowPaymentsAPIError
 
 logger = logging.getLogger(__name__)
 
+STATUS_MAP = MappingProxyType(
+    {
+        "waiting": "waiting for paying",
+        "confirming": "confirming checkout",
+        "finished": "payed successfully",
+        "expired": "checkout expired",
+        "failed": "checkout faild",
+        "refunded": "amount refunded",
+    }
+)
+
+DUPLICATE_WEBHOOK = "duplicate"
+SEEN_WEBHOOKS_MAX = 10_000
+_seen_webhooks: OrderedDict = OrderedDict()
+_seen_webhooks_lock = threading.Lock()
+
+
+def _webhook_key(dto) -> tuple:
+    # Statuses are matched case-insensitively, so "FINISHED" and "finished" are the same delivery
+    return dto.payment_id, dto.payment_status.lower()
+
+
+def _is_duplicate_webhook(dto) -> bool:
+    """Report whether this (payment_id, payment_status) delivery was already processed."""
+    key = _webhook_key(dto)
+    with _seen_webhooks_lock:
+        if key in _seen_webhooks:
+            _seen_webhooks.move_to_end(key)
+            return True
+    return False
+
+
+def _mark_webhook_processed(dto) -> None:
+    """Record a (payment_id, payment_status) delivery once the caller has processed it."""
+    key = _webhook_key(dto)
+    with _seen_webhooks_lock:
+        _seen_webhooks[key] = None
+        _seen_webhooks.move_to_end(key)
+        if len(_seen_webhooks) > SEEN_WEBHOOKS_MAX:
+            _seen_webhooks.popitem(last=False)
+
+
+@cache
+def _nowpayments_settings() -> tuple:
+    """Read the NowPayments settings once per process."""
+    return (
+        getattr(settings, "NOWPAYMENTS_API_KEY", None),
+        getattr(settings, "NOWPAYMENTS_API_URL", NowPaymentServiceImpl.DEFAULT_API_URL),
+    )
+
 
 class NowPaymentServiceImpl(NowPaymentAbstract):
     DEFAULT_API_URL = "https://api-sandbox.nowpayments.io/v1"
-    PAYMENT_URL_TEMPLATE = "https://nowpayments.io/payment/?iid={}"
+    PAYMENT_URL_PREFIX = "https://nowpayments.io/payment/?iid="
     QR_CODE_URL_TEMPLATE = "https://api.qrserver.com/v1/create-qr-code/?size=150x150&data={}"
+    BATCH_MAX_WORKERS = 10
 
     def __init__(self):
-        self.api_key = getattr(settings, "NOWPAYMENTS_API_KEY", None)
-        self.api_url = getattr(settings, "NOWPAYMENTS_API_URL", self.DEFAULT_API_URL)
+        self.api_key, self.api_url = _nowpayments_settings()
         if not self.api_key:
             raise ValueError("NOWPAYMENTS_API_KEY is not set in settings.")
+        self.invoice_url = f"{self.api_url}/payment"
+        self.session = build_session(self._get_headers())
 
     def _get_headers(self) -> dict[str, str]:
         return {"x-api-key": self.api_key, "Content-Type": "application/json"}
 
+    def close(self):
+        self.session.close()
+
     def _get_payment_url(self, payment_id: str) -> str:
-        return self.PAYMENT_URL_TEMPLATE.format(payment_id)
+        return self.PAYMENT_URL_PREFIX + str(payment_id)
 
     def _get_qr_code_url(self, payment_url: str) -> str:
         return self.QR_CODE_URL_TEMPLATE.format(payment_url)
 
     def create_invoice(self, dto):
-        url = f"{self.api_url}/payment"
         try:
-            response = requests.post(url, json=dto, headers=self._get_headers(), timeout=10)
+            response = self.session.post(self.invoice_url, data=dumps(dto), timeout=10)
             response.raise_for_status()
-            response_data = response.json()
+            response_data = parse_json(response)
 
             payment_id = response_data.get("payment_id")
             if not payment_id:
@@ -53,16 +111,31 @@ class NowPaymentServiceImpl(NowPaymentAbstract):
                 logger.error("Response content: %s", e.response.text)
             raise NowPaymentsAPIError("Failed to create payment")
 
+    def create_invoices_batch(self, dtos):
+        """Create invoices concurrently; one invoice response or exception per dto, in input order."""
+        return map_concurrently(self.create_invoice, dtos, self.BATCH_MAX_WORKERS)
+
     def verify_webhook(self, dto):
         if not dto.payment_id or not dto.payment_status:
             logger.warning("Invalid webhook payload received: %s", dto)
             return {"error": "Invalid webhook data"}
-        status_map = {
-            "waiting": "waiting for paying",
-            "confirming": "confirming checkout",
-            "finished": "payed successfully",
-            "expired": "checkout expired",
-            "failed": "checkout faild",
-            "refunded": "amount refunded",
-        }
-        return status_map.get(dto.payment_status.lower())
+        if _is_duplicate_webhook(dto):
+            logger.info("Duplicate webhook delivery for payment %s (%s)", dto.payment_id, dto.payment_status)
+            return DUPLICATE_WEBHOOK
+        return STATUS_MAP.get(dto.payment_status.lower())
+
+    def mark_webhook_processed(self, dto):
+        """Call after the delivery was handled and committed; later retries of it are reported as duplicates."""
+        _mark_webhook_processed(dto)
+
+    def verify_webhooks_batch(self, dtos):
+        get_status = STATUS_MAP.get
+        results = []
+        for dto in dtos:
+            if not dto.payment_id or not dto.payment_status:
+                results.append(self.verify_webhook(dto))
+            elif _is_duplicate_webhook(dto):
+                results.append(DUPLICATE_WEBHOOK)
+            else:
+                results.append(get_status(dto.payment_status.lower()))
+        return results
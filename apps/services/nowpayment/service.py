@@ -1,12 +1,29 @@
+from functools import lru_cache
+
 from apps.services.nowpayment.implementations import NowPaymentServiceImpl
 
 
+@lru_cache(maxsize=1)
+def get_nowpayment_implementation() -> NowPaymentServiceImpl:
+    """Return the process-wide implementation; settings are read on first call only."""
+    return NowPaymentServiceImpl()
+
+
 class NowPaymentService:
     def __init__(self, implementation=None):
-        self.implementation = implementation or NowPaymentServiceImpl()
+        self.implementation = implementation or get_nowpayment_implementation()
 
     def create_invoice(self, invoice_data):
         return self.implementation.create_invoice(invoice_data)
 
+    def create_invoices(self, invoices_data):
+        return self.implementation.create_invoices_batch(invoices_data)
+
     def verify_webhook(self, webhook_data):
         return self.implementation.verify_webhook(webhook_data)
+
+    def mark_webhook_processed(self, webhook_data):
+        return self.implementation.mark_webhook_processed(webhook_data)
+
+    def verify_webhooks(self, webhooks_data):
+        return self.implementation.verify_webhooks_batch(webhooks_data)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StripeTax:
     display_name: str
     percentage: float
@@ -20,7 +20,7 @@ class StripeTax:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckoutItemDTO:
     name: str
     price: int
@@ -31,6 +31,7 @@ class CheckoutItemDTO:
     tax_behavior: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        """Nested lists/dicts are shared with the DTO, not copied; treat the result as read-only."""
         data = {
             "name": self.name,
             "price": self.price,
@@ -40,16 +41,16 @@ class CheckoutItemDTO:
         if self.description is not None:
             data["description"] = self.description
         if self.tax_rates is not None:
-            data["tax_rates"] = self.tax_rates.copy()
+            data["tax_rates"] = self.tax_rates
         if self.price_data is not None:
-            data["price_data"] = self.price_data.copy()
+            data["price_data"] = self.price_data
         if self.tax_behavior is not None:
             data["tax_behavior"] = self.tax_behavior
 
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckoutSessionRequestDTO:
     order_id: str
     payment_method_types: List[str]
@@ -65,30 +66,31 @@ class CheckoutSessionRequestDTO:
     automatic_tax: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
+        """Nested lists/dicts are shared with the DTO, not copied; treat the result as read-only."""
         data = {
             "order_id": self.order_id,
-            "payment_method_types": self.payment_method_types.copy(),
+            "payment_method_types": self.payment_method_types,
             "line_items": [item.to_dict() for item in self.line_items],
             "mode": self.mode,
-            "payment_intent_data": self.payment_intent_data.copy(),
+            "payment_intent_data": self.payment_intent_data,
             "success_url": self.success_url,
             "cancel_url": self.cancel_url,
             "automatic_tax": self.automatic_tax,
         }
 
         if self.metadata is not None:
-            data["metadata"] = self.metadata.copy()
+            data["metadata"] = self.metadata
         if self.expires_at is not None:
             data["expires_at"] = self.expires_at
         if self.client_reference_id is not None:
             data["client_reference_id"] = self.client_reference_id
         if self.tax_id_collection is not None:
-            data["tax_id_collection"] = self.tax_id_collection.copy()
+            data["tax_id_collection"] = self.tax_id_collection
 
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckoutSessionResponseDTO:
     session_id: str
     payment_url: str
@@ -100,7 +102,7 @@ class CheckoutSessionResponseDTO:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebhookEventDTO:
     event_type: str
     payload: Dict[str, Any]
@@ -1,9 +1,13 @@
 import logging
+import time
 
 import stripe
 from django.conf import settings
+from django.db import transaction
 
 from apps.order.models import Order
+from apps.services._http import loads
+from apps.services._stripe_signature import get_webhook_signature_validator
 from apps.services.orders import OrderService
 from apps.services.stripe.abstract import AbstractPaymentService
 from apps.services.stripe.dto import CheckoutSessionRequestDTO, CheckoutSessionResponseDTO, StripeTax, WebhookEventDTO
@@ -14,24 +18,40 @@ stripe.api_key = settings.STRIPE_SECRET_KEY
 
 
 class StripePaymentServiceImpl(AbstractPaymentService):
+    TAX_RATE_CACHE_TTL = 5 * 60
+
+    # Shared by all instances: percentage -> (tax rate id, monotonic expiry)
+    _tax_rate_cache: dict[float, tuple[str, float]] = {}
+
     def get_or_create_tax_rate(self, dto: StripeTax) -> str:
+        cached = self._tax_rate_cache.get(dto.percentage)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
         try:
-            tax_rates = stripe.TaxRate.list(limit=100)
-            for rate in tax_rates.data:
-                if rate.percentage == dto.percentage and rate.active:
-                    return rate.id
-            tax_rate = stripe.TaxRate.create(
-                display_name=dto.display_name,
-                description=dto.description,
-                jurisdiction=dto.jurisdiction,
-                percentage=dto.percentage,
-                inclusive=dto.inclusive,
-            )
-            return tax_rate.id
+            tax_rate_id = self._refresh_tax_rate_cache().get(dto.percentage)
+            if tax_rate_id is None:
+                tax_rate_id = stripe.TaxRate.create(
+                    display_name=dto.display_name,
+                    description=dto.description,
+                    jurisdiction=dto.jurisdiction,
+                    percentage=dto.percentage,
+                    inclusive=dto.inclusive,
+                ).id
+                self._tax_rate_cache[dto.percentage] = (tax_rate_id, time.monotonic() + self.TAX_RATE_CACHE_TTL)
+            return tax_rate_id
         except Exception as e:
             logger.exception(f"Error creating/retrieving tax rate: {e}")
             return None
 
+    def _refresh_tax_rate_cache(self) -> dict[float, str]:
+        """Load every active tax rate (all pages) into the cache and return percentage -> id."""
+        tax_rates = {}
+        for rate in stripe.TaxRate.list(active=True, limit=100).auto_paging_iter():
+            tax_rates.setdefault(rate.percentage, rate.id)
+        expires_at = time.monotonic() + self.TAX_RATE_CACHE_TTL
+        self._tax_rate_cache.update({percentage: (rate_id, expires_at) for percentage, rate_id in tax_rates.items()})
+        return tax_rates
+
     def create_checkout_session(self, dto: CheckoutSessionRequestDTO) -> CheckoutSessionResponseDTO:
         try:
             line_items = []
@@ -86,23 +106,13 @@ class StripePaymentServiceImpl(AbstractPaymentService):
 
     def handle_webhook_event(self, dto: WebhookEventDTO) -> bool:
         try:
-            event = stripe.Webhook.construct_event(
-                dto.payload,
-                dto.signature,
-                settings.STRIPE_WEBHOOK_SECRET
-            )
-
-            event_handlers = {
-                "checkout.session.completed": self.__handle_checkout_session_completed(event),
-                "payment_intent.succeeded": self.__handle_payment_intent_succeeded(event),
-                "charge.succeeded": self.__handle_charge_succeeded(event),
-                "payment_intent.created": self.__handle_payment_intent_created(event),
-                "checkout.session.expired": self.__handle_checkout_session_expired(event),
-            }
+            if not get_webhook_signature_validator().verify_webhook_signature(dto.payload, dto.signature):
+                raise StripeServiceException("Invalid Stripe signature")
+            event = loads(dto.payload)
 
-            handler = event_handlers.get(event["type"])
+            handler = self.EVENT_HANDLERS.get(event["type"])
             if handler:
-                handler(event)
+                handler(self, event)
             else:
                 logger.warning(f"Unhandled Stripe event type: {event['type']}")
 
@@ -122,9 +132,10 @@ class StripePaymentServiceImpl(AbstractPaymentService):
             logger.error(f"Order with ID {order_id} not found.")
             return
         order_service = OrderService()
-        order_service._handle_successful_payment(order)
-        order_service._handle_order_transaction(order)
-        order_service._create_chat(order)
+        with transaction.atomic():
+            order_service._handle_successful_payment(order)
+            order_service._handle_order_transaction(order)
+            order_service._create_chat(order)
 
     def __handle_payment_intent_succeeded(self, event):
         payment_intent = event["data"]["object"]
@@ -160,3 +171,12 @@ class StripePaymentServiceImpl(AbstractPaymentService):
             logger.info(f"Order {order_id} marked as expired.")
         except Order.DoesNotExist:
             logger.error(f"Order with ID {order_id} not found in database.")
+
+    # Event type -> unbound handler, built once at class creation; called as handler(self, event)
+    EVENT_HANDLERS = {
+        "checkout.session.completed": __handle_checkout_session_completed,
+        "payment_intent.succeeded": __handle_payment_intent_succeeded,
+        "charge.succeeded": __handle_charge_succeeded,
+        "payment_intent.created": __handle_payment_intent_created,
+        "checkout.session.expired": __handle_checkout_session_expired,
+    }
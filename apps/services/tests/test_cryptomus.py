@@ -0,0 +1,23 @@
+import unittest
+
+from apps.services.cryptomus.implementations import _SESSION
+
+
+class CryptomusSessionRetryTests(unittest.TestCase):
+    def setUp(self):
+        self.retries = _SESSION.get_adapter("https://").max_retries
+
+    def test_failed_connections_are_retried(self):
+        self.assertGreater(self.retries.connect, 0)
+
+    def test_written_posts_are_never_retried(self):
+        self.assertEqual(self.retries.read, 0)
+        self.assertEqual(self.retries.other, 0)
+        self.assertEqual(self.retries.status, 0)
+        for status_code in (429, 502, 503, 504):
+            with self.subTest(status_code=status_code):
+                self.assertFalse(self.retries.is_retry("POST", status_code, has_retry_after=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
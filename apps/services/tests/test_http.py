@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from apps.services._http import BoundedRetry, build_session, map_concurrently
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    """
+    Counts POSTs; ``/slow`` answers after the client timeout, ``/busy`` answers 503 and
+    ``/throttled`` answers 429 asking for a long ``Retry-After``.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.post_count += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/slow":
+            time.sleep(1)
+            self.send_response(200)
+        elif self.path == "/busy":
+            self.send_response(503)
+        elif self.path == "/throttled":
+            self.send_response(429)
+            self.send_header("Retry-After", "30")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BuildSessionRetryTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _GatewayHandler)
+        self.server.post_count = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.session = self._build_session()
+
+    def _build_session(self, **kwargs):
+        session = build_session({}, **kwargs)
+        # The gateways are HTTPS-only; reuse the configured adapter for the plain-HTTP test server
+        session.mount("http://", session.get_adapter("https://"))
+        return session
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_timed_out_post_is_sent_once(self):
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session.post(f"{self.base_url}/slow", data=b"{}", timeout=(1, 0.2))
+        self.assertEqual(self.server.post_count, 1)
+
+    def test_post_is_retried_on_503(self):
+        with self.assertRaises(requests.exceptions.RetryError):
+            self.session.post(f"{self.base_url}/busy", data=b"{}", timeout=5)
+        self.assertEqual(self.server.post_count, 4)
+
+    def test_retry_after_wait_is_capped(self):
+        start = time.monotonic()
+        with self.assertRaises(requests.exceptions.RetryError):
+            self.session.post(f"{self.base_url}/throttled", data=b"{}", timeout=1)
+        self.assertLess(time.monotonic() - start, 3 * BoundedRetry.MAX_RETRY_AFTER + 1)
+        self.assertEqual(self.server.post_count, 4)
+
+    def test_blocking_pool_is_released_during_retry_sleep(self):
+        session = self._build_session(pool_maxsize=1, pool_block=True)
+        self.addCleanup(session.close)
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        throttled = executor.submit(session.post, f"{self.base_url}/throttled", data=b"{}", timeout=1)
+        while self.server.post_count == 0:
+            time.sleep(0.01)
+
+        # The only pooled connection is free while the throttled request waits to retry
+        start = time.monotonic()
+        response = session.post(f"{self.base_url}/ok", data=b"{}", timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertLess(time.monotonic() - start, BoundedRetry.MAX_RETRY_AFTER)
+        self.assertIsInstance(throttled.exception(), requests.exceptions.RetryError)
+
+    def test_successful_post_is_sent_once(self):
+        response = self.session.post(f"{self.base_url}/ok", data=b"{}", timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.post_count, 1)
+
+
+class MapConcurrentlyTests(unittest.TestCase):
+    def test_returns_result_or_exception_per_item_in_order(self):
+        def create(item):
+            if item == "bad":
+                raise TypeError("not serializable")
+            return {"id": item}
+
+        results = map_concurrently(create, ["a", "bad", "c"], max_workers=2)
+
+        self.assertEqual(results[0], {"id": "a"})
+        self.assertIsInstance(results[1], TypeError)
+        self.assertEqual(results[2], {"id": "c"})
+
+    def test_empty_input(self):
+        self.assertEqual(map_concurrently(str, [], max_workers=4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import hashlib
+import hmac
+import time
+import unittest
+
+from apps.services._stripe_signature import StripeSignatureValidator
+
+SECRET = "whsec_test"
+PAYLOAD = b'{"id":"evt_test","type":"checkout.session.completed"}'
+
+
+def _sign(payload: bytes, timestamp: int, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode(), b"%d." % timestamp + payload, hashlib.sha256).hexdigest()
+
+
+class StripeSignatureValidatorTests(unittest.TestCase):
+    def setUp(self):
+        self.validator = StripeSignatureValidator(SECRET)
+        self.now = int(time.time())
+
+    def test_valid_signature(self):
+        header = f"t={self.now},v1={_sign(PAYLOAD, self.now)}"
+        self.assertTrue(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_valid_signature_with_str_payload(self):
+        header = f"t={self.now},v1={_sign(PAYLOAD, self.now)}"
+        self.assertTrue(self.validator.verify_webhook_signature(PAYLOAD.decode(), header))
+
+    def test_wrong_secret(self):
+        header = f"t={self.now},v1={_sign(PAYLOAD, self.now, secret='whsec_other')}"
+        self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_tampered_payload(self):
+        header = f"t={self.now},v1={_sign(PAYLOAD, self.now)}"
+        self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD + b" ", header))
+
+    def test_stale_timestamp(self):
+        stale = self.now - 301
+        header = f"t={stale},v1={_sign(PAYLOAD, stale)}"
+        self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_future_timestamp_outside_tolerance(self):
+        future = self.now + 301
+        header = f"t={future},v1={_sign(PAYLOAD, future)}"
+        self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_multiple_v1_signatures(self):
+        # During secret rotation Stripe sends one v1 per active secret; any match is accepted
+        header = f"t={self.now},v1={_sign(PAYLOAD, self.now, secret='whsec_old')},v1={_sign(PAYLOAD, self.now)}"
+        self.assertTrue(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_ignores_other_schemes(self):
+        header = f"t={self.now},v0={_sign(PAYLOAD, self.now)}"
+        self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+    def test_malformed_headers(self):
+        signature = _sign(PAYLOAD, self.now)
+        for header in (
+            None,
+            "",
+            "garbage",
+            f"v1={signature}",
+            f"t={self.now}",
+            f"t=abc,v1={signature}",
+            f"t=²,v1={signature}",
+            f"t=-{self.now},v1={signature}",
+            f"t={self.now},v1=not-hex",
+        ):
+            with self.subTest(header=header):
+                self.assertFalse(self.validator.verify_webhook_signature(PAYLOAD, header))
+
+
+if __name__ == "__main__":
+    unittest.main()